@@ -10,46 +10,125 @@ Requirements:
     pip install pycryptodome
 """
 
+import functools
+import mmap
 import os
+import struct
 import sys
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+from Crypto.Hash import keccak as _keccak
+
 # BN254 scalar field modulus
 BN254_R = 0x30644e72e131a029b85045b68181585d2833e84879b9709143e1f593f0000001
 
-def fr_from_bytes(b: bytes) -> int:
-    """Convert 32 big-endian bytes to field element."""
-    return int.from_bytes(b, 'big') % BN254_R
+# One Fr as four big-endian u64 words
+_STRUCT32 = struct.Struct('>4Q')
+
+# Mask for splitting challenges into 127-bit halves
+_MASK127 = (1 << 127) - 1
+
+# Montgomery constants (same as crates/plonk-core/src/field.rs)
+_MASK256 = (1 << 256) - 1
+_R_MONT = (1 << 256) % BN254_R                  # MONT_ONE
+_R2 = (_R_MONT * _R_MONT) % BN254_R             # R2
+_R_INV = pow(_R_MONT, -1, BN254_R)
+_N_PRIME = (-pow(BN254_R, -1, 1 << 256)) & _MASK256  # low 64 bits == INV
+
+def _redc(t: int) -> int:
+    """Montgomery reduction: t * R^-1 mod r, for 0 <= t < r * 2^256."""
+    u = (t + ((t * _N_PRIME) & _MASK256) * BN254_R) >> 256
+    return u - BN254_R if u >= BN254_R else u
+
+def to_mont(x: int) -> int:
+    """Lift a field element into Montgomery form (x * R mod r)."""
+    return _redc((x % BN254_R) * _R2)
+
+def from_mont(x: int) -> int:
+    """Convert a Montgomery-form element back to canonical form."""
+    return _redc(x)
+
+def mont_mul(a: int, b: int) -> int:
+    """Multiply two Montgomery-form elements, result stays in Montgomery form."""
+    return _redc(a * b)
+
+def _make_fr(R: int = BN254_R, _fb=int.from_bytes):
+    """Build the core Fr helpers with the modulus and parser bound as closure locals."""
+    def fr_from_bytes(b: bytes) -> int:
+        """Convert 32 big-endian bytes to field element."""
+        return _fb(b, 'big') % R
 
-def fr_to_bytes(x: int) -> bytes:
-    """Convert field element to 32 big-endian bytes."""
-    return (x % BN254_R).to_bytes(32, 'big')
+    def fr_to_bytes(x: int) -> bytes:
+        """Convert field element to 32 big-endian bytes."""
+        return (x % R).to_bytes(32, 'big')
 
-def fr_add(a: int, b: int) -> int:
-    return (a + b) % BN254_R
+    def fr_add(a: int, b: int) -> int:
+        return (a + b) % R
 
-def fr_sub(a: int, b: int) -> int:
-    return (a - b) % BN254_R
+    def fr_sub(a: int, b: int) -> int:
+        return (a - b) % R
 
-def fr_mul(a: int, b: int) -> int:
-    return (a * b) % BN254_R
+    def fr_mul(a: int, b: int) -> int:
+        return (a * b) % R
+
+    return fr_from_bytes, fr_to_bytes, fr_add, fr_sub, fr_mul
+
+fr_from_bytes, fr_to_bytes, fr_add, fr_sub, fr_mul = _make_fr()
+
+@functools.lru_cache(maxsize=4096)
+def _fr_inv_reduced(a: int) -> int:
+    return pow(a, -1, BN254_R) if a else 0
+
+# Inverses of small signed differences (Lagrange denominators i - j), never evicted
+_LAGRANGE_INV = {d % BN254_R: pow(d, -1, BN254_R) for d in range(-32, 33) if d != 0}
 
 def fr_inv(a: int) -> int:
-    """Modular inverse using extended Euclidean algorithm."""
-    return pow(a, BN254_R - 2, BN254_R)
+    """Modular inverse using extended Euclidean algorithm (0 maps to 0)."""
+    a %= BN254_R
+    inv = _LAGRANGE_INV.get(a)
+    return inv if inv is not None else _fr_inv_reduced(a)
 
 def fr_div(a: int, b: int) -> int:
     return fr_mul(a, fr_inv(b))
 
+def fr_batch_inv(xs: List[int]) -> List[int]:
+    """Invert many field elements with one exponentiation (Montgomery's trick).
+
+    Zero elements map to zero instead of raising.
+    """
+    acc = []
+    running = 1
+    for x in xs:
+        running = fr_mul(running, x if x % BN254_R else 1)
+        acc.append(running)
+    if not acc:
+        return []
+
+    inv = fr_inv(running)
+    result = [0] * len(xs)
+    for i in range(len(xs) - 1, -1, -1):
+        x = xs[i]
+        if x % BN254_R == 0:
+            continue
+        prev = acc[i - 1] if i > 0 else 1
+        result[i] = fr_mul(inv, prev)
+        inv = fr_mul(inv, x)
+    return result
+
+def fr_div_many(nums: List[int], dens: List[int]) -> List[int]:
+    """Element-wise nums[i] / dens[i] sharing a single inversion."""
+    assert len(nums) == len(dens), "nums and dens must have the same length"
+    return [fr_mul(n, d_inv) for n, d_inv in zip(nums, fr_batch_inv(dens))]
+
 @dataclass
 class VerificationKey:
     """Parsed verification key."""
     log2_circuit_size: int
     log2_domain_size: int
     num_public_inputs: int
-    commitments: List[bytes]  # 28 G1 points, 64 bytes each
+    commitment_data: memoryview  # 28 G1 points, 64 bytes each
 
     @classmethod
     def from_bytes(cls, data: bytes) -> 'VerificationKey':
@@ -60,72 +139,65 @@ class VerificationKey:
         log2_domain_size = int.from_bytes(data[32:64], 'big')
         num_public_inputs = int.from_bytes(data[64:96], 'big')
         
-        # Parse commitments (28 x 64 bytes)
-        commitments = []
-        for i in range(28):
-            offset = 96 + i * 64
-            commitments.append(data[offset:offset+64])
+        # Commitments (28 x 64 bytes) stay as a view into the input
+        commitment_data = memoryview(data)[96:96 + 28 * 64]
         
         return cls(
             log2_circuit_size=log2_circuit_size,
             log2_domain_size=log2_domain_size,
             num_public_inputs=num_public_inputs,
-            commitments=commitments,
+            commitment_data=commitment_data,
         )
     
+    def commitment(self, idx: int) -> bytes:
+        """Get G1 commitment at index (64 bytes)."""
+        return bytes(self.commitment_data[idx*64:(idx+1)*64])
+    
+    @property
+    def commitments(self) -> List[bytes]:
+        """All 28 G1 commitments (64 bytes each)."""
+        mv = self.commitment_data
+        return [bytes(mv[o:o + 64]) for o in range(0, len(mv), 64)]
+    
     def circuit_size(self) -> int:
         return 2 ** self.log2_circuit_size
 
+# Proof size in Fr elements is affine in log_n: CONST + LOG_COEFF * log_n
+#   per round: sumcheck univariate (9 | 8) + Gemini fold commitment (2) + Gemini A eval (1)
+#   fixed: pairing point object (16) + wire commitments (16) + [libra concat + sum (3)]
+#          + sumcheck evaluations (41 | 40) + [libra post-sumcheck (8)]
+#          - first Gemini fold, which is not committed (2) + [small IPA (2)]
+#          + Shplonk Q + KZG W (4) + extra protocol data (2 | 1)
+_PROOF_LOG_COEFF_ZK = 9 + 2 + 1
+_PROOF_LOG_COEFF_NZK = 8 + 2 + 1
+_PROOF_CONST_ZK = 16 + 16 + 3 + 41 + 8 - 2 + 2 + 4 + 2
+_PROOF_CONST_NZK = 16 + 16 + 40 - 2 + 4 + 1
+
 @dataclass
 class Proof:
     """Parsed UltraHonk proof."""
-    data: List[bytes]  # Fr elements (32 bytes each)
+    data: memoryview  # Raw proof bytes, Fr elements (32 bytes each)
     log_n: int
     is_zk: bool
     
     @classmethod
     def expected_fr_count(cls, log_n: int, is_zk: bool) -> int:
         """Calculate expected number of Fr elements in proof."""
-        size = 0
-        
-        # Pairing point object
-        size += 16
-        
-        # Wire commitments (8 G1 = 16 Fr)
-        size += 16
-        
-        if is_zk:
-            # Libra concat (2 Fr) + sum (1 Fr)
-            size += 3
-        
-        # Sumcheck univariates
-        univariate_len = 9 if is_zk else 8
-        size += log_n * univariate_len
-        
-        # Sumcheck evaluations
-        size += 41 if is_zk else 40
-        
         if is_zk:
-            # Libra post-sumcheck data
-            size += 8  # libra_eval(1) + grand_sum(2) + quotient(2) + masking(2) + masking_eval(1)
-        
-        # Gemini fold commitments
-        size += (log_n - 1) * 2
-        
-        # Gemini A evaluations
-        size += log_n
-        
-        if is_zk:
-            # Small IPA
-            size += 2
-        
-        # Shplonk Q + KZG W
-        size += 4
-        
-        # Extra protocol data
-        size += 2 if is_zk else 1
-        
-        return size
+            return _PROOF_LOG_COEFF_ZK * log_n + _PROOF_CONST_ZK
+        return _PROOF_LOG_COEFF_NZK * log_n + _PROOF_CONST_NZK
+    
+    @classmethod
+    def detect_config(cls, total_fr: int) -> Optional[Tuple[int, bool]]:
+        """Recover (log_n, is_zk) from a proof's Fr count, preferring ZK."""
+        for is_zk, const, coeff in (
+            (True, _PROOF_CONST_ZK, _PROOF_LOG_COEFF_ZK),
+            (False, _PROOF_CONST_NZK, _PROOF_LOG_COEFF_NZK),
+        ):
+            log_n, rem = divmod(total_fr - const, coeff)
+            if rem == 0 and 4 <= log_n < 30:
+                return log_n, is_zk
+        return None
     
     @classmethod
     def from_bytes(cls, data: bytes, log_n: int, is_zk: bool = True) -> 'Proof':
@@ -136,27 +208,37 @@ class Proof:
         
         assert actual == expected, f"Expected {expected} Fr elements, got {actual}"
         
-        elements = []
-        for i in range(actual):
-            elements.append(data[i*32:(i+1)*32])
-        
-        return cls(data=elements, log_n=log_n, is_zk=is_zk)
+        return cls(data=memoryview(data), log_n=log_n, is_zk=is_zk)
+    
+    def fr(self, idx: int) -> bytes:
+        """Get the Fr element at index (32 bytes)."""
+        return bytes(self.data[idx*32:(idx+1)*32])
+    
+    def fr_limbs(self, idx: int) -> Tuple[int, int, int, int]:
+        """Get the Fr element at index as 4 x u64 little-endian limbs (FrLimbs layout)."""
+        l3, l2, l1, l0 = _STRUCT32.unpack_from(self.data, idx * 32)
+        return l0, l1, l2, l3
+    
+    def frs(self, start: int, count: int) -> List[bytes]:
+        """Get `count` consecutive Fr elements starting at index."""
+        mv = self.data
+        return [bytes(mv[o:o + 32]) for o in range(start * 32, (start + count) * 32, 32)]
     
     def pairing_point_object(self) -> List[bytes]:
         """Get the 16 pairing point object Fr values."""
-        return self.data[0:16]
+        return self.frs(0, 16)
     
     def wire_commitment(self, idx: int) -> bytes:
         """Get G1 commitment at index (64 bytes)."""
         offset = 16 + idx * 2
-        return self.data[offset] + self.data[offset + 1]
+        return bytes(self.data[offset*32:(offset+2)*32])
     
     def libra_sum(self) -> Optional[bytes]:
         """Get libra sum for ZK proofs."""
         if not self.is_zk:
             return None
         offset = 16 + 16 + 2  # ppo + wires + libra_concat
-        return self.data[offset]
+        return self.fr(offset)
     
     def sumcheck_univariate(self, round: int) -> List[bytes]:
         """Get univariate coefficients for a sumcheck round."""
@@ -166,7 +248,7 @@ class Proof:
         
         univariate_len = 9 if self.is_zk else 8
         offset = base + round * univariate_len
-        return self.data[offset:offset + univariate_len]
+        return self.frs(offset, univariate_len)
     
     def sumcheck_evaluations(self) -> List[bytes]:
         """Get all sumcheck evaluations."""
@@ -178,34 +260,63 @@ class Proof:
         base += self.log_n * univariate_len
         
         num_evals = 41 if self.is_zk else 40
-        return self.data[base:base + num_evals]
+        return self.frs(base, num_evals)
 
 
 def keccak256(data: bytes) -> bytes:
     """Compute Keccak256 hash."""
-    try:
-        from Crypto.Hash import keccak
-        k = keccak.new(digest_bits=256)
-        k.update(data)
-        return k.digest()
-    except ImportError:
-        # Fallback using hashlib (Python 3.6+)
-        import hashlib
-        return hashlib.sha3_256(data).digest()
+    k = _keccak.new(digest_bits=256)
+    k.update(data)
+    return k.digest()
+
+
+def keccak256_state(prefix: bytes = b''):
+    """Return a streaming Keccak256 hasher with `prefix` already absorbed."""
+    k = _keccak.new(digest_bits=256)
+    if prefix:
+        k.update(prefix)
+    return k
 
 
 def compute_vk_hash(vk: VerificationKey) -> bytes:
     """Compute VK hash as done by bb."""
     # Hash: log2_circuit_size || log2_domain_size || num_public_inputs || all commitments
-    data = b''
-    data += vk.log2_circuit_size.to_bytes(32, 'big')
-    data += vk.log2_domain_size.to_bytes(32, 'big')
-    data += vk.num_public_inputs.to_bytes(32, 'big')
-    for commitment in vk.commitments:
-        data += commitment
+    k = keccak256_state()
+    k.update(vk.log2_circuit_size.to_bytes(32, 'big'))
+    k.update(vk.log2_domain_size.to_bytes(32, 'big'))
+    k.update(vk.num_public_inputs.to_bytes(32, 'big'))
+    k.update(vk.commitment_data)
     
-    hash_result = keccak256(data)
-    return reduce_to_fr(hash_result)
+    return reduce_to_fr(k.digest())
+
+
+def _map_file(path: Path):
+    """Map a file read-only; the mapping stays alive as long as views into it do."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''  # mmap cannot map empty files
+        # `access` (unlike `prot`) is supported on both POSIX and Windows
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _prefetch(paths: List[Path]):
+    """Ask the kernel to start reading all files now so their I/O overlaps."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        if not path.exists():
+            continue
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+@functools.lru_cache(maxsize=64)
+def _vk_hash_cached(path_str: str, mtime_ns: int) -> bytes:
+    """VK hash for a file, keyed on its mtime so edited files are rehashed."""
+    return compute_vk_hash(VerificationKey.from_bytes(_map_file(Path(path_str))))
 
 
 def reduce_to_fr(h: bytes) -> bytes:
@@ -215,44 +326,59 @@ def reduce_to_fr(h: bytes) -> bytes:
     return reduced.to_bytes(32, 'big')
 
 
+def split_challenge_int(value: int) -> Tuple[int, int]:
+    """Split 254-bit challenge into its lower and upper 127-bit halves."""
+    return value & _MASK127, (value >> 127) & _MASK127
+
+
 def split_challenge(challenge: bytes) -> Tuple[bytes, bytes]:
     """Split 254-bit challenge into two 127-bit values."""
-    value = int.from_bytes(challenge, 'big')
-    
-    # Lower 127 bits
-    lo = value & ((1 << 127) - 1)
-    # Upper 127 bits  
-    hi = (value >> 127) & ((1 << 127) - 1)
-    
+    lo, hi = split_challenge_int(int.from_bytes(challenge, 'big'))
     return (lo.to_bytes(32, 'big'), hi.to_bytes(32, 'big'))
 
 
-def print_hex(name: str, data: bytes, max_len: int = 32):
+class _Out:
+    """Buffers report lines and writes them to stdout in one call."""
+
+    def __init__(self):
+        self._buf: List[str] = []
+
+    def emit(self, s: str = ""):
+        self._buf.append(s)
+        self._buf.append("\n")
+
+    def flush(self):
+        sys.stdout.write(''.join(self._buf))
+        sys.stdout.flush()
+        self._buf.clear()
+
+
+def print_hex(out: _Out, name: str, data: bytes, max_len: int = 32):
     """Print bytes as hex with a name."""
-    hex_str = data.hex()
-    if len(hex_str) > max_len * 2:
-        hex_str = hex_str[:max_len*2] + "..."
-    print(f"  {name}: 0x{hex_str}")
+    hex_str = data[:max_len].hex()
+    if len(data) > max_len:
+        hex_str += "..."
+    out.emit(f"  {name}: 0x{hex_str}")
 
 
-def validate_vk_structure(vk_path: Path) -> VerificationKey:
+def validate_vk_structure(out: _Out, vk_path: Path) -> VerificationKey:
     """Validate VK structure and print details."""
-    print("\n" + "="*60)
-    print("VERIFICATION KEY ANALYSIS")
-    print("="*60)
+    out.emit("\n" + "="*60)
+    out.emit("VERIFICATION KEY ANALYSIS")
+    out.emit("="*60)
     
-    data = vk_path.read_bytes()
-    print(f"\nFile: {vk_path}")
-    print(f"Size: {len(data)} bytes (expected: 1888)")
+    data = _map_file(vk_path)
+    out.emit(f"\nFile: {vk_path}")
+    out.emit(f"Size: {len(data)} bytes (expected: 1888)")
     
     vk = VerificationKey.from_bytes(data)
     
-    print(f"\nHeader Fields:")
-    print(f"  log2_circuit_size: {vk.log2_circuit_size} (circuit size = {vk.circuit_size()})")
-    print(f"  log2_domain_size: {vk.log2_domain_size}")
-    print(f"  num_public_inputs: {vk.num_public_inputs}")
+    out.emit(f"\nHeader Fields:")
+    out.emit(f"  log2_circuit_size: {vk.log2_circuit_size} (circuit size = {vk.circuit_size()})")
+    out.emit(f"  log2_domain_size: {vk.log2_domain_size}")
+    out.emit(f"  num_public_inputs: {vk.num_public_inputs}")
     
-    print(f"\nCommitments ({len(vk.commitments)} G1 points):")
+    out.emit(f"\nCommitments ({len(vk.commitments)} G1 points):")
     commitment_names = [
         "Q_m", "Q_c", "Q_l", "Q_r", "Q_o", "Q_4", 
         "Q_lookup", "Q_arith", "Q_range", "Q_elliptic", "Q_aux",
@@ -262,89 +388,88 @@ def validate_vk_structure(vk_path: Path) -> VerificationKey:
         "Table₁", "Table₂", "Table₃", "Table₄",
         "L_first", "L_last", "???"
     ]
-    for i, (name, comm) in enumerate(zip(commitment_names, vk.commitments)):
-        x = comm[:32].hex()[:16] + "..."
-        y = comm[32:].hex()[:16] + "..."
-        print(f"  [{i:2d}] {name:18s}: x=0x{x}, y=0x{y}")
+    mv = vk.commitment_data
+    for i, name in enumerate(commitment_names[:len(mv) // 64]):
+        # Only the leading 8 bytes of each coordinate are shown
+        x = mv[i*64:i*64 + 8].hex()
+        y = mv[i*64 + 32:i*64 + 40].hex()
+        out.emit(f"  [{i:2d}] {name:18s}: x=0x{x}..., y=0x{y}...")
     
     # Compute and show VK hash
-    vk_hash = compute_vk_hash(vk)
-    print(f"\nComputed VK Hash: 0x{vk_hash.hex()}")
+    vk_hash = _vk_hash_cached(str(vk_path), vk_path.stat().st_mtime_ns)
+    out.emit(f"\nComputed VK Hash: 0x{vk_hash.hex()}")
     
     return vk
 
 
-def validate_proof_structure(proof_path: Path, log_n: int, is_zk: bool = True) -> Proof:
+def validate_proof_structure(out: _Out, proof_path: Path, log_n: int, is_zk: bool = True) -> Proof:
     """Validate proof structure and print details."""
-    print("\n" + "="*60)
-    print("PROOF ANALYSIS")
-    print("="*60)
+    out.emit("\n" + "="*60)
+    out.emit("PROOF ANALYSIS")
+    out.emit("="*60)
     
-    data = proof_path.read_bytes()
+    data = _map_file(proof_path)
     expected_fr = Proof.expected_fr_count(log_n, is_zk)
     expected_bytes = expected_fr * 32
     
-    print(f"\nFile: {proof_path}")
-    print(f"Size: {len(data)} bytes")
-    print(f"Expected: {expected_bytes} bytes ({expected_fr} Fr elements)")
-    print(f"Config: log_n={log_n}, is_zk={is_zk}")
+    out.emit(f"\nFile: {proof_path}")
+    out.emit(f"Size: {len(data)} bytes")
+    out.emit(f"Expected: {expected_bytes} bytes ({expected_fr} Fr elements)")
+    out.emit(f"Config: log_n={log_n}, is_zk={is_zk}")
     
     if len(data) != expected_bytes:
-        print(f"\n⚠️  SIZE MISMATCH!")
-        print(f"  Actual Fr count: {len(data) // 32}")
-        print(f"  Expected Fr count: {expected_fr}")
+        out.emit(f"\n⚠️  SIZE MISMATCH!")
+        out.emit(f"  Actual Fr count: {len(data) // 32}")
+        out.emit(f"  Expected Fr count: {expected_fr}")
         
         # Try to figure out correct config
-        for try_zk in [True, False]:
-            for try_log in range(4, 30):
-                if Proof.expected_fr_count(try_log, try_zk) * 32 == len(data):
-                    print(f"\n  Detected config: log_n={try_log}, is_zk={try_zk}")
-                    log_n = try_log
-                    is_zk = try_zk
-                    break
+        detected = Proof.detect_config(len(data) // 32) if len(data) % 32 == 0 else None
+        if detected is not None:
+            log_n, is_zk = detected
+            out.emit(f"\n  Detected config: log_n={log_n}, is_zk={is_zk}")
     
     proof = Proof.from_bytes(data, log_n, is_zk)
     
-    print(f"\nPairing Point Object (16 Fr values):")
+    out.emit(f"\nPairing Point Object (16 Fr values):")
     for i, fr in enumerate(proof.pairing_point_object()[:4]):
-        print_hex(f"ppo[{i}]", fr)
-    print("  ...")
+        print_hex(out, f"ppo[{i}]", fr)
+    out.emit("  ...")
     
-    print(f"\nWitness Commitments (8 G1 points):")
+    out.emit(f"\nWitness Commitments (8 G1 points):")
     wire_names = ["W₁", "W₂", "W₃", "lookup_counts", "lookup_tags", "W₄", "lookup_inv", "z_perm"]
     for i, name in enumerate(wire_names[:3]):
         comm = proof.wire_commitment(i)
-        print_hex(f"{name} x", comm[:32])
-        print_hex(f"{name} y", comm[32:])
-    print("  ...")
+        print_hex(out, f"{name} x", comm[:32])
+        print_hex(out, f"{name} y", comm[32:])
+    out.emit("  ...")
     
     if is_zk:
-        print(f"\nLibra Data (ZK mode):")
+        out.emit(f"\nLibra Data (ZK mode):")
         libra_sum = proof.libra_sum()
         if libra_sum:
-            print_hex("libra_sum", libra_sum)
+            print_hex(out, "libra_sum", libra_sum)
     
-    print(f"\nSumcheck Univariates (round 0):")
+    out.emit(f"\nSumcheck Univariates (round 0):")
     uni0 = proof.sumcheck_univariate(0)
     for i, coeff in enumerate(uni0[:3]):
-        print_hex(f"u[0][{i}]", coeff)
-    print(f"  ... ({len(uni0)} coefficients total)")
+        print_hex(out, f"u[0][{i}]", coeff)
+    out.emit(f"  ... ({len(uni0)} coefficients total)")
     
-    print(f"\nSumcheck Evaluations:")
+    out.emit(f"\nSumcheck Evaluations:")
     evals = proof.sumcheck_evaluations()
-    print(f"  Count: {len(evals)}")
+    out.emit(f"  Count: {len(evals)}")
     for i, ev in enumerate(evals[:3]):
-        print_hex(f"eval[{i}]", ev)
-    print("  ...")
+        print_hex(out, f"eval[{i}]", ev)
+    out.emit("  ...")
     
     return proof
 
 
-def validate_sumcheck_round_zero(proof: Proof, is_zk: bool):
+def validate_sumcheck_round_zero(out: _Out, proof: Proof, is_zk: bool):
     """Validate the first sumcheck round."""
-    print("\n" + "="*60)
-    print("SUMCHECK VALIDATION (Round 0)")
-    print("="*60)
+    out.emit("\n" + "="*60)
+    out.emit("SUMCHECK VALIDATION (Round 0)")
+    out.emit("="*60)
     
     univariate = proof.sumcheck_univariate(0)
     u0 = fr_from_bytes(univariate[0])
@@ -352,51 +477,51 @@ def validate_sumcheck_round_zero(proof: Proof, is_zk: bool):
     
     sum_u = fr_add(u0, u1)
     
-    print(f"\n  u[0][0] = 0x{u0:064x}")
-    print(f"  u[0][1] = 0x{u1:064x}")
-    print(f"  u[0][0] + u[0][1] = 0x{sum_u:064x}")
+    out.emit(f"\n  u[0][0] = 0x{u0:064x}")
+    out.emit(f"  u[0][1] = 0x{u1:064x}")
+    out.emit(f"  u[0][0] + u[0][1] = 0x{sum_u:064x}")
     
     if is_zk:
         libra_sum = proof.libra_sum()
         if libra_sum:
             ls = fr_from_bytes(libra_sum)
-            print(f"\n  libra_sum = 0x{ls:064x}")
-            print(f"\n  For ZK: initial_target = libra_sum × libra_challenge")
-            print(f"  We need: u[0][0] + u[0][1] == initial_target")
+            out.emit(f"\n  libra_sum = 0x{ls:064x}")
+            out.emit(f"\n  For ZK: initial_target = libra_sum × libra_challenge")
+            out.emit(f"  We need: u[0][0] + u[0][1] == initial_target")
             
             # Check if sum_u == libra_sum (initial case without challenge)
             if sum_u == ls:
-                print(f"\n  ✅ Sum equals libra_sum directly (libra_challenge = 1?)")
+                out.emit(f"\n  ✅ Sum equals libra_sum directly (libra_challenge = 1?)")
             else:
                 # Try to compute implied libra_challenge
                 if ls != 0:
                     implied_challenge = fr_div(sum_u, ls)
-                    print(f"\n  Implied libra_challenge = sum / libra_sum")
-                    print(f"                          = 0x{implied_challenge:064x}")
+                    out.emit(f"\n  Implied libra_challenge = sum / libra_sum")
+                    out.emit(f"                          = 0x{implied_challenge:064x}")
     else:
         if sum_u == 0:
-            print(f"\n  ✅ Sum equals 0 (correct for non-ZK)")
+            out.emit(f"\n  ✅ Sum equals 0 (correct for non-ZK)")
         else:
-            print(f"\n  ⚠️  Sum is non-zero for non-ZK proof!")
+            out.emit(f"\n  ⚠️  Sum is non-zero for non-ZK proof!")
 
 
-def validate_public_inputs(pi_path: Path, vk: VerificationKey):
+def validate_public_inputs(out: _Out, pi_path: Path, vk: VerificationKey):
     """Validate public inputs file."""
-    print("\n" + "="*60)
-    print("PUBLIC INPUTS ANALYSIS")
-    print("="*60)
+    out.emit("\n" + "="*60)
+    out.emit("PUBLIC INPUTS ANALYSIS")
+    out.emit("="*60)
     
-    data = pi_path.read_bytes()
-    print(f"\nFile: {pi_path}")
-    print(f"Size: {len(data)} bytes")
-    print(f"Expected: {vk.num_public_inputs * 32} bytes ({vk.num_public_inputs} inputs)")
+    data = _map_file(pi_path)
+    out.emit(f"\nFile: {pi_path}")
+    out.emit(f"Size: {len(data)} bytes")
+    out.emit(f"Expected: {vk.num_public_inputs * 32} bytes ({vk.num_public_inputs} inputs)")
     
     num_inputs = len(data) // 32
-    print(f"\nPublic Inputs ({num_inputs}):")
+    out.emit(f"\nPublic Inputs ({num_inputs}):")
     for i in range(num_inputs):
         pi = data[i*32:(i+1)*32]
         value = int.from_bytes(pi, 'big')
-        print(f"  [{i}] = {value} (0x{pi.hex()})")
+        out.emit(f"  [{i}] = {value} (0x{pi.hex()})")
 
 
 def main():
@@ -426,35 +551,44 @@ def main():
         print("  bb prove -b ./target/simple_square.json -w ./target/simple_square.gz --oracle_hash keccak --write_vk -o ./target/keccak")
         sys.exit(1)
     
+    out = _Out()
+    try:
+        _run_validation(out, test_dir)
+    finally:
+        out.flush()
+
+
+def _run_validation(out: _Out, test_dir: Path):
     vk_path = test_dir / "vk"
     proof_path = test_dir / "proof"
     pi_path = test_dir / "public_inputs"
+    _prefetch([vk_path, proof_path, pi_path])
     
-    print(f"\nUsing data from: {test_dir}")
+    out.emit(f"\nUsing data from: {test_dir}")
     
-    print("="*60)
-    print("ULTRAHONK PROOF VALIDATION")
-    print("="*60)
-    print(f"\nTest Circuit: simple_square (x² = y)")
-    print(f"Expected: x=3, y=9")
+    out.emit("="*60)
+    out.emit("ULTRAHONK PROOF VALIDATION")
+    out.emit("="*60)
+    out.emit(f"\nTest Circuit: simple_square (x² = y)")
+    out.emit(f"Expected: x=3, y=9")
     
     # Validate VK
-    vk = validate_vk_structure(vk_path)
+    vk = validate_vk_structure(out, vk_path)
     
     # Validate proof
-    proof = validate_proof_structure(proof_path, vk.log2_circuit_size, is_zk=True)
+    proof = validate_proof_structure(out, proof_path, vk.log2_circuit_size, is_zk=True)
     
     # Validate public inputs
     if pi_path.exists():
-        validate_public_inputs(pi_path, vk)
+        validate_public_inputs(out, pi_path, vk)
     
     # Validate sumcheck
-    validate_sumcheck_round_zero(proof, is_zk=True)
+    validate_sumcheck_round_zero(out, proof, is_zk=True)
     
-    print("\n" + "="*60)
-    print("VALIDATION COMPLETE")
-    print("="*60)
-    print("\nSee docs/theory.md for full theoretical explanation.")
+    out.emit("\n" + "="*60)
+    out.emit("VALIDATION COMPLETE")
+    out.emit("="*60)
+    out.emit("\nSee docs/theory.md for full theoretical explanation.")
 
 
 if __name__ == "__main__":